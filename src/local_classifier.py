@@ -0,0 +1,422 @@
+# backend/src/local_classifier.py
+"""Local, dependency-light review classifier.
+
+Scores a review with a linear bag-of-words model (a seed sentiment lexicon
+out of the box, or ridge-regression weights trained on the Yelp CSV used by
+fynd_task1.py) and builds template-grade summaries and action hints from it.
+Inference is plain dict lookups, so it runs in microseconds and never needs
+the network.
+
+Train / evaluate from the command line:
+
+    python -m src.local_classifier train yelp.csv -o src/local_model.json
+    python -m src.local_classifier evaluate yelp.csv -m src/local_model.json
+"""
+import argparse
+import csv
+import json
+import math
+import os
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+# ==================== FEATURES ====================
+
+NEGATORS = {"not", "no", "never", "nothing", "nobody", "hardly", "without"}
+NEGATION_WINDOW = 3
+CLAUSE_WORDS = {"but", "however", "although"}
+CLAUSE_RE = re.compile(r"[.!?;]+|\bbut\b|\bhowever\b|\balthough\b")
+# Words, or punctuation that ends a negation scope (commas included)
+SCOPE_RE = re.compile(r"([a-z]+(?:'[a-z]+)?)|[.!?;,]")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens with simple negation marking ("not good" -> "not_good").
+
+    Negation covers the next NEGATION_WINDOW words and stops at clause
+    punctuation, commas and words like "but".
+    """
+    tokens = []
+    negate = 0
+    text = text.lower().replace("\u2019", "'").replace("\u2018", "'")
+    for match in SCOPE_RE.finditer(text):
+        raw = match.group(1)
+        if raw is None or raw in CLAUSE_WORDS:
+            negate = 0
+            if raw:
+                tokens.append(raw)
+            continue
+        if raw in NEGATORS or raw.endswith("n't"):
+            negate = NEGATION_WINDOW
+            continue
+        if negate:
+            tokens.append("not_" + raw)
+            negate -= 1
+        else:
+            tokens.append(raw)
+    return tokens
+
+
+# Seed lexicon used when no trained model file is available. Weights are in
+# "stars" units on top of a neutral 3.0 bias.
+SEED_LEXICON: Dict[str, float] = {
+    # positive
+    "amazing": 1.8, "awesome": 1.7, "excellent": 1.8, "fantastic": 1.8, "outstanding": 1.8,
+    "perfect": 1.7, "best": 1.5, "love": 1.5, "loved": 1.5, "wonderful": 1.7,
+    "delicious": 1.5, "great": 1.4, "incredible": 1.6, "superb": 1.7, "highly": 0.8,
+    "recommend": 1.0, "friendly": 1.0, "fresh": 0.8, "tasty": 1.1, "good": 0.9,
+    "nice": 0.8, "enjoyed": 1.1, "happy": 1.0, "pleasant": 0.9, "helpful": 0.9,
+    "attentive": 1.0, "clean": 0.7, "fast": 0.6, "quick": 0.6, "reasonable": 0.6,
+    "thanks": 0.5, "thank": 0.5, "fine": 0.3, "decent": 0.3, "okay": -0.1, "ok": -0.1,
+    # negative
+    "terrible": -2.0, "horrible": -2.0, "awful": -2.0, "worst": -2.0, "disgusting": -2.0,
+    "rude": -1.6, "bad": -1.3, "poor": -1.3, "disappointing": -1.4, "disappointed": -1.4,
+    "cold": -0.8, "slow": -0.9, "dirty": -1.3, "overpriced": -1.1, "bland": -1.0,
+    "waited": -0.6, "wait": -0.3, "mediocre": -1.0, "stale": -1.1,
+    "wrong": -1.0, "refund": -1.0, "complaint": -1.0, "unfriendly": -1.3, "gross": -1.6,
+    "avoid": -1.6, "waste": -1.5, "expensive": -0.6, "pricey": -0.5, "average": -0.5,
+    "meh": -0.8, "lacking": -0.8, "ignored": -1.2, "burnt": -1.0, "sick": -1.5,
+}
+SEED_NEGATION_FACTOR = -0.6
+
+# Aspect keywords for template summaries and action hints.
+ASPECTS: Dict[str, Tuple[str, ...]] = {
+    "food": ("food", "meal", "dish", "dishes", "taste", "flavor", "menu", "pizza", "burger",
+             "breakfast", "lunch", "dinner", "dessert", "coffee", "drinks"),
+    "service": ("service", "staff", "waiter", "waitress", "server", "servers", "manager",
+                "host", "hostess", "employee", "employees", "customer"),
+    "price": ("price", "prices", "pricey", "expensive", "cheap", "value", "cost", "overpriced",
+              "bill", "money"),
+    "wait time": ("wait", "waited", "waiting", "slow", "minutes", "hour", "hours", "line",
+                  "delay", "delayed"),
+    "ambience": ("ambience", "ambiance", "atmosphere", "music", "decor", "vibe", "noisy",
+                 "loud", "seating"),
+    "cleanliness": ("clean", "dirty", "hygiene", "bathroom", "restroom", "sticky", "smell"),
+}
+
+ASPECT_ACTIONS: Dict[str, Tuple[str, str]] = {
+    "food": ("Highlight the praised dishes in menus and promotions.",
+             "Review food quality and preparation with the kitchen team."),
+    "service": ("Recognise the staff involved and share the feedback with the team.",
+                "Retrain staff on courtesy and follow up with the customer."),
+    "price": ("Emphasise value for money in marketing.",
+              "Review pricing and portion sizes against competitors."),
+    "wait time": ("Keep current staffing levels at peak hours.",
+                  "Audit peak-hour staffing and order turnaround times."),
+    "ambience": ("Feature the atmosphere in photos and listings.",
+                 "Review noise levels, seating and decor."),
+    "cleanliness": ("Maintain the current cleaning schedule.",
+                    "Run a cleanliness inspection and tighten the cleaning schedule."),
+}
+
+
+# ==================== MODEL ====================
+
+@dataclass
+class LocalAnalysis:
+    predicted_rating: float
+    matched_terms: int
+    word_count: int
+    aspects: Dict[str, int] = field(default_factory=dict)  # aspect -> +1 / 0 / -1
+    confident: bool = False
+    mismatch: bool = False
+    summary: str = ""
+    recommended_actions: str = ""
+    ai_response: str = ""
+
+    @property
+    def polarity(self) -> int:
+        """+1 positive, -1 negative, 0 neutral/unknown."""
+        return polarity_of(self.predicted_rating, self.matched_terms)
+
+
+def polarity_of(predicted_rating: float, matched_terms: int, margin: float = 0.5) -> int:
+    if matched_terms == 0:
+        return 0
+    if predicted_rating >= 3.0 + margin:
+        return 1
+    if predicted_rating <= 3.0 - margin:
+        return -1
+    return 0
+
+
+class LocalClassifier:
+    """Linear bag-of-words star-rating model: stars = bias + sum(w_t) / sqrt(#matched)."""
+
+    def __init__(self, weights: Dict[str, float], bias: float = 3.0,
+                 negation_fallback: bool = False, source: str = "seed",
+                 confidence_margin: float = 1.0):
+        self.weights = weights
+        self.bias = bias
+        self.negation_fallback = negation_fallback
+        self.source = source
+        self.confidence_margin = confidence_margin
+
+    @classmethod
+    def seed(cls) -> "LocalClassifier":
+        return cls(dict(SEED_LEXICON), bias=3.0, negation_fallback=True, source="seed")
+
+    @classmethod
+    def load(cls, path: Optional[str]) -> "LocalClassifier":
+        """Load trained weights from JSON, falling back to the seed lexicon."""
+        if not path or not os.path.exists(path):
+            return cls.seed()
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return cls(
+                {k: float(v) for k, v in data["weights"].items()},
+                bias=float(data.get("bias", 3.0)),
+                source=path,
+                confidence_margin=float(data.get("confidence_margin", 1.0)),
+            )
+        except Exception as e:
+            print(f"Local classifier: could not load {path} ({e}), using seed lexicon")
+            return cls.seed()
+
+    def _weight(self, token: str) -> Optional[float]:
+        w = self.weights.get(token)
+        if w is None and self.negation_fallback and token.startswith("not_"):
+            base = self.weights.get(token[4:])
+            if base is not None:
+                w = SEED_NEGATION_FACTOR * base
+        return w
+
+    def score_tokens(self, tokens: List[str]) -> Tuple[float, int]:
+        """Return (predicted stars clipped to 1..5, number of distinct matched terms)."""
+        total = 0.0
+        matched = 0
+        for token in set(tokens):
+            w = self._weight(token)
+            if w is not None:
+                total += w
+                matched += 1
+        if matched == 0:
+            return self.bias, 0
+        stars = self.bias + total / math.sqrt(matched)
+        return min(5.0, max(1.0, stars)), matched
+
+    def predict(self, text: str) -> Tuple[float, int]:
+        return self.score_tokens(tokenize(text))
+
+    def aspects(self, text: str) -> Dict[str, int]:
+        """Aspect -> polarity of the clauses that mention it."""
+        found: Dict[str, float] = {}
+        for clause in CLAUSE_RE.split(text.lower()):
+            tokens = tokenize(clause)
+            if not tokens:
+                continue
+            words = {t[4:] if t.startswith("not_") else t for t in tokens}
+            hits = [name for name, keys in ASPECTS.items() if words.intersection(keys)]
+            if not hits:
+                continue
+            stars, matched = self.score_tokens(tokens)
+            for name in hits:
+                found[name] = found.get(name, 0.0) + (stars - 3.0 if matched else 0.0)
+        return {name: (1 if s > 0.25 else -1 if s < -0.25 else 0) for name, s in found.items()}
+
+    def analyze(self, review: str, rating: int) -> LocalAnalysis:
+        tokens = tokenize(review)
+        stars, matched = self.score_tokens(tokens)
+        analysis = LocalAnalysis(
+            predicted_rating=round(stars, 2),
+            matched_terms=matched,
+            word_count=len(tokens),
+            aspects=self.aspects(review),
+        )
+        analysis.confident = matched > 0 and abs(stars - 3.0) >= self.confidence_margin
+        # Only a confident reading that contradicts a clearly positive or
+        # negative star rating counts as a mismatch
+        rating_polarity = (rating > 3) - (rating < 3)
+        analysis.mismatch = (
+            analysis.confident and rating_polarity != 0 and analysis.polarity == -rating_polarity
+        )
+        analysis.summary = build_summary(analysis)
+        analysis.recommended_actions = build_actions(analysis, rating)
+        analysis.ai_response = build_response(analysis, rating)
+        return analysis
+
+
+# ==================== TEMPLATES ====================
+
+def _join(names: List[str]) -> str:
+    if len(names) <= 1:
+        return "".join(names)
+    return ", ".join(names[:-1]) + " and " + names[-1]
+
+
+def build_summary(analysis: LocalAnalysis) -> str:
+    praised = [a for a, p in analysis.aspects.items() if p > 0]
+    criticised = [a for a, p in analysis.aspects.items() if p < 0]
+    if praised and criticised:
+        return f"Mixed review: praises the {_join(praised)} but criticises the {_join(criticised)}."
+    if praised:
+        return f"Customer praises the {_join(praised)}."
+    if criticised:
+        return f"Customer is unhappy with the {_join(criticised)}."
+    mentioned = list(analysis.aspects)
+    tone = {1: "positive", -1: "negative", 0: "neutral"}[analysis.polarity]
+    if mentioned:
+        return f"Customer left a {tone} review mentioning the {_join(mentioned)}."
+    return f"Customer left a {tone} review without specific details."
+
+
+def build_actions(analysis: LocalAnalysis, rating: int) -> str:
+    actions = []
+    for name, pol in analysis.aspects.items():
+        positive, negative = ASPECT_ACTIONS[name]
+        if pol < 0 or (pol == 0 and rating <= 2):
+            actions.append(negative)
+        elif pol > 0:
+            actions.append(positive)
+    if not actions:
+        if rating >= 4:
+            actions.append("Share this feedback with the team to reinforce best practices.")
+        elif rating == 3:
+            actions.append("Follow up with the customer to identify specific pain points.")
+        else:
+            actions.append("Contact the customer to resolve their issues.")
+    text = " ".join(f"{i}. {a}" for i, a in enumerate(actions[:2], 1))
+    if analysis.mismatch:
+        text = mismatch_note(analysis, rating) + " " + text
+    return text
+
+
+def mismatch_note(analysis: LocalAnalysis, rating: int) -> str:
+    tone = "positive" if analysis.polarity > 0 else "negative"
+    return f"[Check: review text reads {tone} but rating is {rating}/5.]"
+
+
+def build_response(analysis: LocalAnalysis, rating: int) -> str:
+    praised = [a for a, p in analysis.aspects.items() if p > 0]
+    criticised = [a for a, p in analysis.aspects.items() if p < 0]
+    if rating >= 4:
+        text = f"Thank you for the {rating}-star review!"
+        if praised:
+            text += f" We're delighted you enjoyed the {_join(praised)}."
+        return text + " We look forward to welcoming you back."
+    if rating == 3:
+        text = "Thank you for your feedback."
+        if criticised:
+            text += f" We're sorry the {_join(criticised)} didn't meet expectations and are working on it."
+        return text + " We're always working to improve."
+    text = "We sincerely apologize that your experience fell short of expectations."
+    if criticised:
+        text += f" We're looking into the issues with the {_join(criticised)}."
+    return text + " We'd like the opportunity to make it right."
+
+
+# ==================== TRAINING / EVALUATION ====================
+
+def _read_yelp_csv(path: str, limit: Optional[int] = None) -> Tuple[List[str], List[int]]:
+    texts, stars = [], []
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        for row in csv.DictReader(f):
+            try:
+                s = int(float(row["stars"]))
+            except (KeyError, TypeError, ValueError):
+                continue
+            if 1 <= s <= 5 and row.get("text"):
+                texts.append(row["text"])
+                stars.append(s)
+            if limit and len(texts) >= limit:
+                break
+    return texts, stars
+
+
+def train(csv_path: str, vocab_size: int = 3000, min_df: int = 5, l2: float = 10.0,
+          limit: Optional[int] = None) -> dict:
+    """Fit ridge-regression token weights on the Yelp CSV (columns: text, stars)."""
+    try:
+        import numpy as np
+    except ImportError:
+        raise SystemExit("Training requires numpy: pip install numpy")
+
+    texts, stars = _read_yelp_csv(csv_path, limit)
+    if not texts:
+        raise SystemExit(f"No usable rows in {csv_path}")
+    docs = [set(tokenize(t)) for t in texts]
+
+    df_counts: Dict[str, int] = {}
+    for doc in docs:
+        for token in doc:
+            df_counts[token] = df_counts.get(token, 0) + 1
+    vocab = [t for t, c in sorted(df_counts.items(), key=lambda kv: -kv[1]) if c >= min_df][:vocab_size]
+    index = {t: i for i, t in enumerate(vocab)}
+
+    X = np.zeros((len(docs), len(vocab)), dtype=np.float32)
+    for row, doc in enumerate(docs):
+        cols = [index[t] for t in doc if t in index]
+        if cols:
+            X[row, cols] = 1.0 / math.sqrt(len(cols))
+    y = np.asarray(stars, dtype=np.float64)
+    bias = float(y.mean())
+
+    A = X.T.astype(np.float64) @ X + l2 * np.eye(len(vocab))
+    w = np.linalg.solve(A, X.T.astype(np.float64) @ (y - bias))
+
+    return {
+        "bias": round(bias, 4),
+        "weights": {t: round(float(v), 4) for t, v in zip(vocab, w) if abs(v) >= 1e-3},
+        "confidence_margin": 1.0,
+        "trained_on": len(texts),
+    }
+
+
+def evaluate(classifier: LocalClassifier, csv_path: str, limit: Optional[int] = None,
+             fast_path_max_words: int = 25) -> dict:
+    """Exact / within-one accuracy and the share of reviews the fast path would take."""
+    texts, stars = _read_yelp_csv(csv_path, limit)
+    exact = within_one = confident = polar = polar_correct = fast = 0
+    for text, actual in zip(texts, stars):
+        analysis = classifier.analyze(text, actual)
+        predicted = int(round(analysis.predicted_rating))
+        exact += predicted == actual
+        within_one += abs(predicted - actual) <= 1
+        if analysis.confident:
+            confident += 1
+            if actual != 3:
+                polar += 1
+                polar_correct += (analysis.polarity > 0) == (actual >= 4)
+            fast += analysis.word_count <= fast_path_max_words and not analysis.mismatch
+    n = max(len(texts), 1)
+    return {
+        "model": classifier.source,
+        "reviews": len(texts),
+        "exact_accuracy": round(exact / n, 4),
+        "within_one_accuracy": round(within_one / n, 4),
+        "confident_rate": round(confident / n, 4),
+        "confident_polarity_accuracy": round(polar_correct / max(polar, 1), 4),
+        "fast_path_rate": round(fast / n, 4),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Train or evaluate the local review classifier")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_train = sub.add_parser("train", help="Fit weights from a Yelp CSV")
+    p_train.add_argument("csv")
+    p_train.add_argument("-o", "--output", default=os.path.join(os.path.dirname(__file__), "local_model.json"))
+    p_train.add_argument("--vocab-size", type=int, default=3000)
+    p_train.add_argument("--l2", type=float, default=10.0)
+    p_train.add_argument("--limit", type=int, default=None)
+
+    p_eval = sub.add_parser("evaluate", help="Report accuracy and fast-path coverage on a Yelp CSV")
+    p_eval.add_argument("csv")
+    p_eval.add_argument("-m", "--model", default=None)
+    p_eval.add_argument("--limit", type=int, default=None)
+
+    args = parser.parse_args(argv)
+    if args.command == "train":
+        model = train(args.csv, vocab_size=args.vocab_size, l2=args.l2, limit=args.limit)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(model, f)
+        print(f"✓ Trained on {model['trained_on']} reviews, {len(model['weights'])} terms -> {args.output}")
+    else:
+        print(json.dumps(evaluate(LocalClassifier.load(args.model), args.csv, args.limit), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,29 @@
 # backend/src/main.py
 from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field, validator
 from typing import Optional, List
 from datetime import datetime, timezone, timedelta
 import os
 from dotenv import load_dotenv
 import json
+import csv
+import io
+import base64
+import uuid
 import httpx
 import asyncio
+import time
+import random
+from collections import deque
 from supabase import create_client, Client
 
+try:
+    from .local_classifier import LocalClassifier, LocalAnalysis, mismatch_note, polarity_of
+except ImportError:  # running src/main.py directly (e.g. Vercel)
+    from local_classifier import LocalClassifier, LocalAnalysis, mismatch_note, polarity_of
+
 load_dotenv()
 
 # Initialize FastAPI
@@ -23,6 +36,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Export-Cursor"],
 )
 
 # Initialize Supabase
@@ -32,6 +46,66 @@ GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
 
 supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
 
+# Local fast-path classifier
+# FAST_PATH_MODE: "on" skips LLM calls for short, unambiguous reviews,
+# "shadow" only records what would have been skipped, "off" disables it.
+# Switch to "on" once `evaluate` or the shadow agreement numbers look good.
+# Local templates are always used as the degraded-mode fallback.
+FAST_PATH_MODE = os.getenv("FAST_PATH_MODE", "shadow").lower()
+FAST_PATH_MAX_WORDS = int(os.getenv("FAST_PATH_MAX_WORDS", "25"))
+FAST_PATH_RESPONSE_MAX_WORDS = int(os.getenv("FAST_PATH_RESPONSE_MAX_WORDS", "4"))
+# Share of skipped reviews still summarised by Gemini in the background ("on" mode)
+FAST_PATH_SHADOW_SAMPLE_RATE = float(os.getenv("FAST_PATH_SHADOW_SAMPLE_RATE", "0.1"))
+LOCAL_MODEL_PATH = os.getenv(
+    "LOCAL_MODEL_PATH", os.path.join(os.path.dirname(__file__), "local_model.json")
+)
+
+local_classifier = LocalClassifier.load(LOCAL_MODEL_PATH)
+
+# Per-process counters, exported by /api/admin/fast-path/stats
+fast_path_stats = {
+    "reviews": 0,
+    "eligible_reviews": 0,
+    "local_reviews": 0,
+    "llm_calls_skipped": 0,
+    "llm_fallbacks": 0,
+    "rating_mismatches": 0,
+    "shadow_calls": 0,
+    "eligible_agreement_checks": 0,
+    "eligible_agreements": 0,
+    "other_agreement_checks": 0,
+    "other_agreements": 0,
+}
+
+# Background shadow summaries, referenced so they aren't garbage collected
+_shadow_tasks = set()
+
+# Latency budget and hedged LLM requests
+# Every review gets REQUEST_BUDGET_SECONDS end to end. The Gemini calls share
+# all of it except PERSIST_RESERVE_SECONDS, which is kept for the Supabase
+# insert. A call slower than the observed HEDGE_PERCENTILE latency for its
+# kind is duplicated and the first answer wins.
+REQUEST_BUDGET_SECONDS = float(os.getenv("REQUEST_BUDGET_SECONDS", "10"))
+PERSIST_RESERVE_SECONDS = float(os.getenv("PERSIST_RESERVE_SECONDS", "2"))
+HEDGE_PERCENTILE = float(os.getenv("HEDGE_PERCENTILE", "0.95"))
+HEDGE_DEFAULT_DELAY_SECONDS = float(os.getenv("HEDGE_DEFAULT_DELAY_SECONDS", "3"))
+HEDGE_MIN_DELAY_SECONDS = float(os.getenv("HEDGE_MIN_DELAY_SECONDS", "0.5"))
+HEDGE_MIN_SAMPLES = 20
+LATENCY_WINDOW = 200
+
+# Recent successful call latencies per call kind
+llm_latencies = {}
+
+# Per-process counters, exported by /api/admin/latency/stats
+latency_stats = {
+    "requests": 0,
+    "llm_calls": 0,
+    "hedged_calls": 0,
+    "hedge_wins": 0,
+    "llm_calls_timed_out": 0,
+    "budget_exhausted": 0,
+}
+
 # ==================== PYDANTIC MODELS ====================
 
 class ReviewRequest(BaseModel):
@@ -62,10 +136,166 @@ class AdminStatsResponse(BaseModel):
     recent_reviews: List[ReviewResponse]
 
 
+class FastPathStatsResponse(BaseModel):
+    mode: str
+    model: str
+    reviews: int
+    eligible_reviews: int
+    local_reviews: int
+    llm_calls_skipped: int
+    llm_fallbacks: int
+    rating_mismatches: int
+    shadow_calls: int
+    eligible_agreement_checks: int
+    eligible_agreements: int
+    other_agreement_checks: int
+    other_agreements: int
+    eligible_rate: float
+    skip_rate: float
+    eligible_agreement_rate: float
+    other_agreement_rate: float
+
+
+class LatencyStatsResponse(BaseModel):
+    budget_seconds: float
+    requests: int
+    llm_calls: int
+    hedged_calls: int
+    hedge_wins: int
+    llm_calls_timed_out: int
+    budget_exhausted: int
+    hedge_rate: float
+    hedge_delays: dict
+
+
 # ==================== LLM FUNCTIONS ====================
 
-async def generate_ai_response(review: str, rating: int) -> str:
-    """Generate AI response to user review using Gemini"""
+GEMINI_URL = "https://generativelanguage.googleapis.com/v1beta/models/gemini-1.5-flash:generateContent"
+
+
+class Deadline:
+    """Absolute latency budget shared by the downstream calls of a request"""
+
+    def __init__(self, seconds: float):
+        self.expires_at = time.monotonic() + seconds
+        # Set when a downstream call gave up because the budget ran out
+        self.exhausted = False
+
+    def reserve(self, seconds: float) -> "Deadline":
+        """A deadline `seconds` earlier than this one, leaving that much for later work"""
+        earlier = Deadline(0)
+        earlier.expires_at = self.expires_at - seconds
+        return earlier
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+
+def record_latency(kind: str, seconds: float) -> None:
+    llm_latencies.setdefault(kind, deque(maxlen=LATENCY_WINDOW)).append(seconds)
+
+
+def hedge_delay(kind: str) -> float:
+    """Observed HEDGE_PERCENTILE latency of this call kind, after which a duplicate is fired"""
+    samples = llm_latencies.get(kind)
+    if not samples or len(samples) < HEDGE_MIN_SAMPLES:
+        return HEDGE_DEFAULT_DELAY_SECONDS
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(HEDGE_PERCENTILE * len(ordered)))
+    return max(HEDGE_MIN_DELAY_SECONDS, ordered[index])
+
+
+async def _post_gemini(client: httpx.AsyncClient, payload: dict) -> Optional[str]:
+    response = await client.post(GEMINI_URL, json=payload, params={"key": GEMINI_API_KEY})
+    if response.status_code == 200:
+        result = response.json()
+        if 'candidates' in result and len(result['candidates']) > 0:
+            text = result['candidates'][0]['content']['parts'][0]['text'].strip()
+            if text:
+                return text
+    return None
+
+
+async def call_gemini(kind: str, prompt: str, generation_config: dict, deadline: Deadline,
+                      shadow: bool = False) -> Optional[str]:
+    """Call Gemini within `deadline`, hedging with a duplicate request when the first one is slow.
+
+    Returns None when both attempts fail or the budget runs out, so callers
+    can fall back to their canned text. Only the primary request's latency
+    feeds the hedge percentile; if it is still running when the call ends
+    (the hedge won or the budget ran out) its elapsed time is recorded as a
+    lower bound.
+
+    `shadow` calls run off the request path: they are never hedged and stay
+    out of latency_stats and the hedge percentiles.
+    """
+    def count(name: str) -> None:
+        if not shadow:
+            latency_stats[name] += 1
+
+    if deadline.expired:
+        deadline.exhausted = True
+        count("llm_calls_timed_out")
+        return None
+
+    payload = {"contents": [{"parts": [{"text": prompt}]}], "generationConfig": generation_config}
+    count("llm_calls")
+
+    async with httpx.AsyncClient(timeout=deadline.remaining()) as client:
+        started = {}
+
+        def launch() -> asyncio.Task:
+            task = asyncio.create_task(_post_gemini(client, payload))
+            started[task] = time.monotonic()
+            return task
+
+        primary = launch()
+        pending = {primary}
+        hedged = shadow  # shadow calls never fire a hedge
+        try:
+            while pending:
+                timeout = deadline.remaining()
+                if not hedged:
+                    timeout = min(timeout, hedge_delay(kind))
+                done, pending = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is not None:
+                        print(f"LLM Error in {kind}: {task.exception()}")
+                    elif task.result():
+                        if task is not primary:
+                            count("hedge_wins")
+                        elif not shadow:
+                            record_latency(kind, time.monotonic() - started[primary])
+                        return task.result()
+                if done:
+                    continue
+                if deadline.expired:
+                    deadline.exhausted = True
+                    count("llm_calls_timed_out")
+                    return None
+                if not hedged:
+                    hedged = True
+                    count("hedged_calls")
+                    pending.add(launch())
+            return None
+        finally:
+            if primary in pending and not shadow:
+                record_latency(kind, time.monotonic() - started[primary])
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def generate_ai_response(review: str, rating: int, deadline: Deadline,
+                               fallback: Optional[str] = None) -> str:
+    """Generate AI response to user review using Gemini, or `fallback` if it fails"""
     prompt = f"""You are a professional and empathetic customer service representative responding to a review.
 
 Customer Rating: {rating}/5 stars
@@ -79,50 +309,30 @@ Write a brief, warm, and professional response that:
 
 Response:"""
 
-    try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                "https://generativelanguage.googleapis.com/v1beta/models/gemini-1.5-flash:generateContent",
-                json={
-                    "contents": [{"parts": [{"text": prompt}]}],
-                    "generationConfig": {
-                        "temperature": 0.7,
-                        "maxOutputTokens": 200,
-                        "topP": 0.9,
-                    }
-                },
-                params={"key": GEMINI_API_KEY}
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                if 'candidates' in result and len(result['candidates']) > 0:
-                    text = result['candidates'][0]['content']['parts'][0]['text']
-                    return text.strip()
-            
-            # Fallback response
-            responses = {
-                5: "Thank you so much for the wonderful 5-star review! We're thrilled you had such a great experience with us. Your positive feedback truly motivates our team!",
-                4: "Thank you for your 4-star review! We're glad you enjoyed your experience. We'd love to hear what could make it even better!",
-                3: "Thank you for your feedback. We appreciate you taking the time to share. We're always working to improve our service!",
-                2: "Thank you for letting us know about your experience. We're sorry it wasn't quite what you expected. We'd like to make it right!",
-                1: "We sincerely apologize that your experience fell short of expectations. Your feedback is important, and we'd like the opportunity to improve.",
-            }
-            return responses.get(rating, responses[3])
-    except Exception as e:
-        print(f"LLM Error in generate_ai_response: {e}")
-        responses = {
-            5: "Thank you so much for the wonderful 5-star review! We're thrilled you had such a great experience with us.",
-            4: "Thank you for your 4-star review! We're glad you enjoyed your experience.",
-            3: "Thank you for your feedback. We appreciate you taking the time to share.",
-            2: "Thank you for letting us know about your experience. We're sorry it wasn't quite what you expected.",
-            1: "We sincerely apologize that your experience fell short of expectations.",
-        }
-        return responses.get(rating, responses[3])
-
-
-async def generate_ai_summary(review: str) -> str:
-    """Generate summary of review for admin"""
+    text = await call_gemini("response", prompt, {
+        "temperature": 0.7,
+        "maxOutputTokens": 200,
+        "topP": 0.9,
+    }, deadline)
+    if text:
+        return text
+
+    # Fallback response
+    if fallback:
+        return fallback
+    responses = {
+        5: "Thank you so much for the wonderful 5-star review! We're thrilled you had such a great experience with us. Your positive feedback truly motivates our team!",
+        4: "Thank you for your 4-star review! We're glad you enjoyed your experience. We'd love to hear what could make it even better!",
+        3: "Thank you for your feedback. We appreciate you taking the time to share. We're always working to improve our service!",
+        2: "Thank you for letting us know about your experience. We're sorry it wasn't quite what you expected. We'd like to make it right!",
+        1: "We sincerely apologize that your experience fell short of expectations. Your feedback is important, and we'd like the opportunity to improve.",
+    }
+    return responses.get(rating, responses[3])
+
+
+async def generate_ai_summary(review: str, deadline: Deadline, fallback: Optional[str] = None,
+                              shadow: bool = False) -> str:
+    """Generate summary of review for admin, or `fallback` if it fails"""
     prompt = f"""Extract the key points from this customer review in 1-2 concise sentences (max 50 words).
 Focus on specific issues, praise, or problems mentioned.
 
@@ -130,37 +340,17 @@ Review: "{review}"
 
 Summary (be specific, not generic):"""
 
-    try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                "https://generativelanguage.googleapis.com/v1beta/models/gemini-1.5-flash:generateContent",
-                json={
-                    "contents": [{"parts": [{"text": prompt}]}],
-                    "generationConfig": {
-                        "temperature": 0.3,
-                        "maxOutputTokens": 100,
-                        "topP": 0.9,
-                    }
-                },
-                params={"key": GEMINI_API_KEY}
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                if 'candidates' in result and len(result['candidates']) > 0:
-                    text = result['candidates'][0]['content']['parts'][0]['text']
-                    clean_text = text.strip()
-                    if clean_text:
-                        return clean_text
-            
-            return "Review provides customer feedback."
-    except Exception as e:
-        print(f"LLM Error in generate_ai_summary: {e}")
-        return "Review provides customer feedback."
+    text = await call_gemini("summary", prompt, {
+        "temperature": 0.3,
+        "maxOutputTokens": 100,
+        "topP": 0.9,
+    }, deadline, shadow=shadow)
+    return text or fallback or "Review provides customer feedback."
 
 
-async def generate_recommended_actions(review: str, rating: int) -> str:
-    """Generate recommended business actions for admin"""
+async def generate_recommended_actions(review: str, rating: int, deadline: Deadline,
+                                       fallback: Optional[str] = None) -> str:
+    """Generate recommended business actions for admin, or `fallback` if it fails"""
     prompt = f"""Based on this customer feedback, suggest 1-2 specific, concrete business actions.
 
 Rating: {rating}/5 stars
@@ -173,44 +363,240 @@ Provide 2 actionable items (max 60 words):
 
 Actions:"""
 
-    try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                "https://generativelanguage.googleapis.com/v1beta/models/gemini-1.5-flash:generateContent",
-                json={
-                    "contents": [{"parts": [{"text": prompt}]}],
-                    "generationConfig": {
-                        "temperature": 0.6,
-                        "maxOutputTokens": 150,
-                        "topP": 0.9,
-                    }
-                },
-                params={"key": GEMINI_API_KEY}
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                if 'candidates' in result and len(result['candidates']) > 0:
-                    text = result['candidates'][0]['content']['parts'][0]['text']
-                    clean_text = text.strip()
-                    if clean_text:
-                        return clean_text
-            
-            # Fallback based on rating
-            if rating >= 4:
-                return "1. Share this feedback with the team to reinforce best practices. 2. Feature this positive review in marketing."
-            elif rating == 3:
-                return "1. Identify specific pain points mentioned. 2. Create improvement plan and track progress."
-            else:
-                return "1. Contact customer immediately to resolve issues. 2. Implement corrective actions and follow up."
-    except Exception as e:
-        print(f"LLM Error in generate_recommended_actions: {e}")
-        if rating >= 4:
-            return "1. Share this feedback with the team to reinforce best practices. 2. Feature this review in marketing."
-        elif rating == 3:
-            return "1. Identify specific improvements needed. 2. Create and implement action plan."
+    text = await call_gemini("actions", prompt, {
+        "temperature": 0.6,
+        "maxOutputTokens": 150,
+        "topP": 0.9,
+    }, deadline)
+    if text:
+        return text
+
+    # Fallback based on rating
+    if fallback:
+        return fallback
+    if rating >= 4:
+        return "1. Share this feedback with the team to reinforce best practices. 2. Feature this positive review in marketing."
+    elif rating == 3:
+        return "1. Identify specific pain points mentioned. 2. Create improvement plan and track progress."
+    else:
+        return "1. Contact customer immediately to resolve issues. 2. Implement corrective actions and follow up."
+
+
+# ==================== LOCAL FAST PATH ====================
+
+def _record_agreement(analysis: LocalAnalysis, llm_summary: str, eligible: bool) -> None:
+    """Compare the local polarity with the polarity of the LLM's own summary.
+
+    Reviews eligible for the fast path and the rest are counted separately,
+    so the eligible rate describes the quality of the output that gets skipped.
+    """
+    summary_rating, summary_terms = local_classifier.predict(llm_summary)
+    summary_polarity = polarity_of(summary_rating, summary_terms)
+    if analysis.polarity == 0 or summary_polarity == 0:
+        return
+    prefix = "eligible" if eligible else "other"
+    fast_path_stats[f"{prefix}_agreement_checks"] += 1
+    if summary_polarity == analysis.polarity:
+        fast_path_stats[f"{prefix}_agreements"] += 1
+
+
+async def _shadow_summary(review: str, analysis: LocalAnalysis) -> None:
+    """Summarise a skipped review with Gemini off the request path to measure agreement"""
+    summary = await generate_ai_summary(
+        review, Deadline(REQUEST_BUDGET_SECONDS), fallback=analysis.summary, shadow=True
+    )
+    if summary is not analysis.summary:
+        _record_agreement(analysis, summary, eligible=True)
+
+
+async def _local(text: str) -> str:
+    return text
+
+
+async def generate_review_content(review: str, rating: int, deadline: Deadline) -> tuple:
+    """Return (ai_response, ai_summary, recommended_actions).
+
+    Short, unambiguous reviews are answered by the local classifier without
+    calling Gemini for the admin-facing fields (and, for very short reviews,
+    the customer response too). The local templates also replace the canned
+    fallback strings when Gemini fails.
+    """
+    analysis = local_classifier.analyze(review, rating)
+    fast_path_stats["reviews"] += 1
+    if analysis.mismatch:
+        fast_path_stats["rating_mismatches"] += 1
+
+    eligible = (
+        FAST_PATH_MODE in ("on", "shadow")
+        and analysis.confident
+        and not analysis.mismatch
+        and analysis.word_count <= FAST_PATH_MAX_WORDS
+    )
+    skip_admin = eligible and FAST_PATH_MODE == "on"
+    skip_response = skip_admin and analysis.word_count <= FAST_PATH_RESPONSE_MAX_WORDS
+    if eligible:
+        fast_path_stats["eligible_reviews"] += 1
+    if skip_admin:
+        fast_path_stats["local_reviews"] += 1
+        fast_path_stats["llm_calls_skipped"] += 3 if skip_response else 2
+        if random.random() < FAST_PATH_SHADOW_SAMPLE_RATE:
+            fast_path_stats["shadow_calls"] += 1
+            task = asyncio.create_task(_shadow_summary(review, analysis))
+            _shadow_tasks.add(task)
+            task.add_done_callback(_shadow_tasks.discard)
+
+    # Generate AI content in parallel
+    ai_response, ai_summary, recommended_actions = await asyncio.gather(
+        _local(analysis.ai_response) if skip_response
+        else generate_ai_response(review, rating, deadline, fallback=analysis.ai_response),
+        _local(analysis.summary) if skip_admin
+        else generate_ai_summary(review, deadline, fallback=analysis.summary),
+        _local(analysis.recommended_actions) if skip_admin
+        else generate_recommended_actions(review, rating, deadline, fallback=analysis.recommended_actions),
+    )
+
+    if not skip_response and ai_response is analysis.ai_response:
+        fast_path_stats["llm_fallbacks"] += 1
+    if not skip_admin:
+        if ai_summary is analysis.summary:
+            fast_path_stats["llm_fallbacks"] += 1
         else:
-            return "1. Contact customer to resolve issues. 2. Implement corrective actions."
+            _record_agreement(analysis, ai_summary, eligible)
+        if recommended_actions is analysis.recommended_actions:
+            fast_path_stats["llm_fallbacks"] += 1
+        elif analysis.mismatch:
+            recommended_actions = mismatch_note(analysis, rating) + " " + recommended_actions
+
+    return ai_response, ai_summary, recommended_actions
+
+
+# ==================== BULK EXPORT ====================
+
+EXPORT_COLUMNS = ["id", "rating", "user_review", "ai_response", "ai_summary",
+                  "recommended_actions", "created_at"]
+# Rows newer than this are left for the next export, so reviews whose
+# insert commits after the export snapshot never fall behind the cursor.
+EXPORT_SAFETY_LAG_SECONDS = float(os.getenv("EXPORT_SAFETY_LAG_SECONDS", "60"))
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+
+def encode_cursor(row: dict) -> str:
+    raw = json.dumps({"created_at": row["created_at"], "id": row["id"]})
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple:
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        created_at, row_id = data["created_at"], data["id"]
+        if not isinstance(created_at, str) or not isinstance(row_id, str):
+            raise ValueError("cursor values must be strings")
+        datetime.fromisoformat(created_at)
+        return created_at, str(uuid.UUID(row_id))
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid export cursor")
+
+
+def _export_query(start: Optional[datetime], end: Optional[datetime]):
+    query = supabase.table("reviews").select(",".join(EXPORT_COLUMNS))
+    if start:
+        query = query.gte("created_at", start.isoformat())
+    if end:
+        query = query.lt("created_at", end.isoformat())
+    return query
+
+
+def iter_review_chunks(start: Optional[datetime], end: Optional[datetime],
+                       after: Optional[tuple], until: tuple, chunk_size: int):
+    """Yield lists of rows ordered by (created_at, id), keyset-paged after `after` up to `until`"""
+    until_ts, until_id = until
+    while True:
+        query = _export_query(start, end).lte("created_at", until_ts)
+        if after:
+            ts, row_id = after
+            query = query.or_(f'created_at.gt."{ts}",and(created_at.eq."{ts}",id.gt.{row_id})')
+        try:
+            result = query.order("created_at").order("id").limit(chunk_size).execute()
+        except Exception as e:
+            # Headers are already sent; raising aborts the connection so the
+            # client sees a truncated transfer instead of a clean end.
+            print(f"Error exporting reviews after {after}: {e}")
+            raise
+        rows = [r for r in (result.data or [])
+                if not (r["created_at"] == until_ts and r["id"] > until_id)]
+        if rows:
+            yield rows
+        if len(result.data or []) < chunk_size:
+            return
+        last = result.data[-1]
+        after = (last["created_at"], last["id"])
+
+
+def stream_ndjson(chunks):
+    for rows in chunks:
+        yield "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in rows)
+
+
+def stream_csv(chunks):
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_COLUMNS, extrasaction="ignore")
+    writer.writeheader()
+    yield buffer.getvalue()
+    for rows in chunks:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(rows)
+        yield buffer.getvalue()
+
+
+class _ParquetSink(io.RawIOBase):
+    """Write-only file that hands written bytes back to the stream while keeping offsets"""
+
+    def __init__(self):
+        self.position = 0
+        self.parts = []
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        self.parts.append(bytes(b))
+        self.position += len(b)
+        return len(b)
+
+    def tell(self):
+        return self.position
+
+    def drain(self) -> bytes:
+        data = b"".join(self.parts)
+        self.parts = []
+        return data
+
+
+def stream_parquet(chunks, pa, pq):
+    """One row group per chunk; only the footer metadata grows with the export"""
+    schema = pa.schema([
+        ("id", pa.string()),
+        ("rating", pa.int16()),
+        ("user_review", pa.string()),
+        ("ai_response", pa.string()),
+        ("ai_summary", pa.string()),
+        ("recommended_actions", pa.string()),
+        ("created_at", pa.string()),
+    ])
+    sink = _ParquetSink()
+    writer = pq.ParquetWriter(sink, schema, compression="snappy")
+    try:
+        for rows in chunks:
+            writer.write_table(pa.Table.from_pylist(rows, schema=schema))
+            yield sink.drain()
+    finally:
+        writer.close()
+    yield sink.drain()
 
 
 # ==================== API ENDPOINTS ====================
@@ -224,12 +610,12 @@ async def health_check():
 @app.post("/api/reviews", response_model=ReviewResponse)
 async def submit_review(request: ReviewRequest):
     """Submit a new review and get AI response"""
+    deadline = Deadline(REQUEST_BUDGET_SECONDS)
+    llm_deadline = deadline.reserve(PERSIST_RESERVE_SECONDS)
+    latency_stats["requests"] += 1
     try:
-        # Generate AI content in parallel
-        ai_response, ai_summary, recommended_actions = await asyncio.gather(
-            generate_ai_response(request.user_review, request.rating),
-            generate_ai_summary(request.user_review),
-            generate_recommended_actions(request.user_review, request.rating)
+        ai_response, ai_summary, recommended_actions = await generate_review_content(
+            request.user_review, request.rating, llm_deadline
         )
         
         # Insert into Supabase
@@ -246,7 +632,16 @@ async def submit_review(request: ReviewRequest):
             "created_at": current_time
         }
         
-        result = supabase.table("reviews").insert(data).execute()
+        # Run the blocking insert off the event loop, bounded by what is left
+        # of the budget. On timeout the insert may still land after the 504.
+        try:
+            result = await asyncio.wait_for(
+                asyncio.to_thread(supabase.table("reviews").insert(data).execute),
+                timeout=deadline.remaining(),
+            )
+        except asyncio.TimeoutError:
+            deadline.exhausted = True
+            raise HTTPException(status_code=504, detail="Timed out saving review")
         
         if not result.data:
             raise HTTPException(status_code=500, detail="Failed to save review")
@@ -262,9 +657,14 @@ async def submit_review(request: ReviewRequest):
             created_at=review_data["created_at"]
         )
     
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"Error: {e}")
         raise HTTPException(status_code=500, detail=f"Error processing review: {str(e)}")
+    finally:
+        if deadline.exhausted or llm_deadline.exhausted:
+            latency_stats["budget_exhausted"] += 1
 
 
 @app.get("/api/reviews", response_model=dict)
@@ -296,6 +696,61 @@ async def get_reviews(page: int = Query(1, ge=1), limit: int = Query(10, ge=1, l
         raise HTTPException(status_code=500, detail="Error fetching reviews")
 
 
+@app.get("/api/reviews/export")
+async def export_reviews(
+    format: str = Query("ndjson", pattern="^(ndjson|csv|parquet)$"),
+    start: Optional[datetime] = Query(None, description="Include reviews created at or after this time"),
+    end: Optional[datetime] = Query(None, description="Include reviews created before this time"),
+    cursor: Optional[str] = Query(None, description="X-Export-Cursor from a previous export"),
+    chunk_size: int = Query(1000, ge=1, le=5000),
+):
+    """Stream all matching reviews as NDJSON, CSV or Parquet in keyset-paged chunks.
+
+    The export is bounded by the newest matching row older than
+    EXPORT_SAFETY_LAG_SECONDS; its cursor is returned in the X-Export-Cursor
+    header so the next export can fetch only newer rows. The header is sent
+    before the data, so clients must only keep it if the transfer completed:
+    a database error mid-stream aborts the connection.
+    """
+    after = decode_cursor(cursor) if cursor else None
+
+    pa = pq = None
+    if format == "parquet":
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise HTTPException(status_code=501, detail="Parquet export requires pyarrow")
+
+    # created_at is stored as IST wall-clock time (see submit_review)
+    ist = timezone(timedelta(hours=5, minutes=30))
+    cutoff = datetime.now(ist) - timedelta(seconds=EXPORT_SAFETY_LAG_SECONDS)
+    try:
+        newest = _export_query(start, end).lt("created_at", cutoff.isoformat())\
+            .order("created_at", desc=True).order("id", desc=True).limit(1).execute()
+    except Exception as e:
+        print(f"Error: {e}")
+        raise HTTPException(status_code=500, detail="Error exporting reviews")
+
+    headers = {"Content-Disposition": f"attachment; filename=reviews-export.{format}"}
+    until = (newest.data[0]["created_at"], newest.data[0]["id"]) if newest.data else None
+    if until and (not after or until > after):
+        headers["X-Export-Cursor"] = encode_cursor(newest.data[0])
+        chunks = iter_review_chunks(start, end, after, until, chunk_size)
+    else:
+        if cursor:
+            headers["X-Export-Cursor"] = cursor
+        chunks = iter([])
+
+    if format == "csv":
+        body = stream_csv(chunks)
+    elif format == "parquet":
+        body = stream_parquet(chunks, pa, pq)
+    else:
+        body = stream_ndjson(chunks)
+    return StreamingResponse(body, media_type=EXPORT_MEDIA_TYPES[format], headers=headers)
+
+
 @app.get("/api/admin/stats", response_model=AdminStatsResponse)
 async def get_admin_stats():
     """Get admin statistics"""
@@ -342,6 +797,39 @@ async def get_admin_stats():
         raise HTTPException(status_code=500, detail="Error fetching stats")
 
 
+@app.get("/api/admin/fast-path/stats", response_model=FastPathStatsResponse)
+async def get_fast_path_stats():
+    """Local classifier skip rate and agreement with the LLM (per worker process)"""
+    reviews = fast_path_stats["reviews"]
+    eligible_checks = fast_path_stats["eligible_agreement_checks"]
+    other_checks = fast_path_stats["other_agreement_checks"]
+    return FastPathStatsResponse(
+        mode=FAST_PATH_MODE,
+        model=local_classifier.source,
+        eligible_rate=round(fast_path_stats["eligible_reviews"] / reviews, 4) if reviews else 0,
+        skip_rate=round(fast_path_stats["local_reviews"] / reviews, 4) if reviews else 0,
+        eligible_agreement_rate=(
+            round(fast_path_stats["eligible_agreements"] / eligible_checks, 4) if eligible_checks else 0
+        ),
+        other_agreement_rate=(
+            round(fast_path_stats["other_agreements"] / other_checks, 4) if other_checks else 0
+        ),
+        **fast_path_stats
+    )
+
+
+@app.get("/api/admin/latency/stats", response_model=LatencyStatsResponse)
+async def get_latency_stats():
+    """Hedge rate per LLM call and latency budget exhaustion per review (per worker process)"""
+    calls = latency_stats["llm_calls"]
+    return LatencyStatsResponse(
+        budget_seconds=REQUEST_BUDGET_SECONDS,
+        hedge_rate=round(latency_stats["hedged_calls"] / calls, 4) if calls else 0,
+        hedge_delays={kind: round(hedge_delay(kind), 3) for kind in ("response", "summary", "actions")},
+        **latency_stats
+    )
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
@@ -0,0 +1,8 @@
+import os
+import sys
+
+# src.main creates the Supabase client at import time; tests never reach it.
+os.environ.setdefault("SUPABASE_URL", "http://localhost:54321")
+os.environ.setdefault("SUPABASE_KEY", "test-key")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,257 @@
+import base64
+import csv
+import io
+import json
+import re
+import sys
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+import src.main as main
+
+
+def make_rows():
+    # Three rows per timestamp so keyset pages split ties on created_at
+    rows = []
+    for i in range(12):
+        rows.append({
+            "id": str(uuid.UUID(int=(i * 7919) % 997 + 1)),
+            "rating": i % 5 + 1,
+            "user_review": f"review {i}, with a comma\nand a newline",
+            "ai_response": "response",
+            "ai_summary": "summary",
+            "recommended_actions": "actions",
+            "created_at": f"2025-01-0{1 + i // 3}T10:00:00",
+        })
+    return sorted(rows, key=lambda r: (r["created_at"], r["id"]))
+
+
+class FakeQuery:
+    """Just enough of the postgrest query builder for the export queries"""
+
+    KEYSET = re.compile(r'created_at\.gt\."(.+?)",and\(created_at\.eq\."(.+?)",id\.gt\.(.+)\)')
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.filters = []
+        self.orders = []
+        self.size = None
+
+    def select(self, columns):
+        return self
+
+    def gte(self, column, value):
+        self.filters.append(lambda r: r[column] >= value)
+        return self
+
+    def lt(self, column, value):
+        self.filters.append(lambda r: r[column] < value)
+        return self
+
+    def lte(self, column, value):
+        self.filters.append(lambda r: r[column] <= value)
+        return self
+
+    def or_(self, expression):
+        ts, _, row_id = self.KEYSET.fullmatch(expression).groups()
+        self.filters.append(lambda r: (r["created_at"], r["id"]) > (ts, row_id))
+        return self
+
+    def order(self, column, desc=False):
+        self.orders.append((column, desc))
+        return self
+
+    def limit(self, size):
+        self.size = size
+        return self
+
+    def execute(self):
+        data = [r for r in self.rows if all(f(r) for f in self.filters)]
+        # Later order() calls are tie-breakers, so apply them first (sorts are stable)
+        for column, desc in reversed(self.orders):
+            data.sort(key=lambda r: r[column], reverse=desc)
+        return type("Result", (), {"data": data[:self.size]})
+
+
+class FakeSupabase:
+    def __init__(self, rows, fail_after=None):
+        self.rows = rows
+        self.fail_after = fail_after
+        self.queries = 0
+
+    def table(self, name):
+        self.queries += 1
+        if self.fail_after is not None and self.queries > self.fail_after:
+            raise RuntimeError("database unavailable")
+        return FakeQuery(self.rows)
+
+
+@pytest.fixture
+def rows(monkeypatch):
+    rows = make_rows()
+    monkeypatch.setattr(main, "supabase", FakeSupabase(rows))
+    return rows
+
+
+@pytest.fixture
+def client():
+    return TestClient(main.app)
+
+
+def ist_now(seconds_ago=0):
+    ist = timezone(timedelta(hours=5, minutes=30))
+    return (datetime.now(ist) - timedelta(seconds=seconds_ago)).isoformat()
+
+
+def export(client, **params):
+    response = client.get("/api/reviews/export", params=params)
+    assert response.status_code == 200, response.text
+    ids = [json.loads(line)["id"] for line in response.text.splitlines()]
+    return ids, response.headers.get("X-Export-Cursor")
+
+
+def key(row):
+    return row["created_at"], row["id"]
+
+
+def export_ids(after, until, chunk_size):
+    chunks = main.iter_review_chunks(None, None, after, until, chunk_size)
+    return [r["id"] for chunk in chunks for r in chunk]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 100])
+def test_keyset_paging_returns_every_row_once(rows, chunk_size):
+    assert export_ids(None, key(rows[-1]), chunk_size) == [r["id"] for r in rows]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 100])
+def test_rows_tied_with_until_but_after_it_are_excluded(rows, chunk_size):
+    # rows[7] shares created_at with rows[6] and rows[8]
+    assert export_ids(None, key(rows[7]), chunk_size) == [r["id"] for r in rows[:8]]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 100])
+def test_cursor_round_trip_resumes_after_the_row(rows, chunk_size):
+    after = main.decode_cursor(main.encode_cursor(rows[4]))
+
+    assert after == key(rows[4])
+    assert export_ids(after, key(rows[-1]), chunk_size) == [r["id"] for r in rows[5:]]
+
+
+def test_streams_serialise_every_row(rows):
+    ndjson = "".join(main.stream_ndjson(iter([rows[:5], rows[5:]])))
+    assert [json.loads(line) for line in ndjson.splitlines()] == rows
+
+    csv_text = "".join(main.stream_csv(iter([rows[:5], rows[5:]])))
+    assert csv_text.splitlines()[0] == ",".join(main.EXPORT_COLUMNS)
+    assert csv_text.count("with a comma") == len(rows)
+
+
+@pytest.mark.parametrize("payload", [
+    {"created_at": 1, "id": 2},
+    {"created_at": '2025-01-01T00:00:00",id.gt.0', "id": str(uuid.uuid4())},
+    {"created_at": "2025-01-01T00:00:00", "id": "not-a-uuid"},
+    {"id": str(uuid.uuid4())},
+])
+def test_invalid_cursor_is_rejected(payload):
+    cursor = base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+    with pytest.raises(HTTPException) as exc:
+        main.decode_cursor(cursor)
+    assert exc.value.status_code == 400
+
+
+def test_garbage_cursor_is_rejected():
+    with pytest.raises(HTTPException) as exc:
+        main.decode_cursor("%%%")
+    assert exc.value.status_code == 400
+
+
+def test_export_endpoint_streams_every_row(rows, client):
+    ids, cursor = export(client, chunk_size=5)
+
+    assert ids == [r["id"] for r in rows]
+    assert cursor == main.encode_cursor(rows[-1])
+
+
+def test_export_endpoint_filters_by_date_range(rows, client):
+    ids, cursor = export(client, start="2025-01-02T00:00:00", end="2025-01-04T00:00:00", chunk_size=2)
+
+    assert ids == [r["id"] for r in rows[3:9]]
+    assert cursor == main.encode_cursor(rows[8])
+
+
+def test_recent_rows_wait_for_the_next_export(rows, client, monkeypatch):
+    recent = dict(rows[0], id=str(uuid.uuid4()), created_at=ist_now(seconds_ago=5))
+    rows.append(recent)
+
+    ids, cursor = export(client)
+    assert recent["id"] not in ids
+    assert cursor == main.encode_cursor(rows[-2])
+
+    monkeypatch.setattr(main, "EXPORT_SAFETY_LAG_SECONDS", 0)
+    ids, next_cursor = export(client, cursor=cursor)
+    assert ids == [recent["id"]]
+    assert next_cursor == main.encode_cursor(recent)
+
+
+def test_up_to_date_cursor_is_echoed_back(rows, client):
+    cursor = main.encode_cursor(rows[-1])
+
+    ids, returned = export(client, cursor=cursor)
+    assert ids == []
+    assert returned == cursor
+
+
+def test_empty_table_echoes_cursor(client, monkeypatch):
+    monkeypatch.setattr(main, "supabase", FakeSupabase([]))
+    cursor = main.encode_cursor({"created_at": "2025-01-01T10:00:00", "id": str(uuid.uuid4())})
+
+    assert export(client, cursor=cursor) == ([], cursor)
+    assert export(client) == ([], None)
+
+
+def test_export_endpoint_csv(rows, client):
+    response = client.get("/api/reviews/export", params={"format": "csv", "chunk_size": 4})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert list(csv.DictReader(io.StringIO(response.text))) == [
+        {k: str(v) for k, v in r.items()} for r in rows
+    ]
+
+
+def test_export_endpoint_rejects_bad_cursor(rows, client):
+    response = client.get("/api/reviews/export", params={"cursor": "%%%"})
+    assert response.status_code == 400
+
+
+def test_export_error_mid_stream_aborts_the_response(client, monkeypatch):
+    # Query 1 finds the newest row, query 2 is the first page, query 3 fails
+    monkeypatch.setattr(main, "supabase", FakeSupabase(make_rows(), fail_after=2))
+
+    with pytest.raises(RuntimeError, match="database unavailable"):
+        client.get("/api/reviews/export", params={"chunk_size": 5})
+
+
+def test_parquet_without_pyarrow_is_501(rows, client, monkeypatch):
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    monkeypatch.setitem(sys.modules, "pyarrow.parquet", None)
+
+    response = client.get("/api/reviews/export", params={"format": "parquet"})
+    assert response.status_code == 501
+
+
+def test_export_endpoint_parquet(rows, client):
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    response = client.get("/api/reviews/export", params={"format": "parquet", "chunk_size": 5})
+    assert response.status_code == 200
+
+    parquet = pq.ParquetFile(io.BytesIO(response.content))
+    assert parquet.metadata.num_row_groups == 3
+    assert parquet.read().to_pylist() == rows
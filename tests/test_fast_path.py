@@ -0,0 +1,149 @@
+import asyncio
+
+import pytest
+
+import src.main as main
+
+
+@pytest.fixture(autouse=True)
+def fresh_state(monkeypatch):
+    monkeypatch.setattr(main, "fast_path_stats", {k: 0 for k in main.fast_path_stats})
+    monkeypatch.setattr(main, "latency_stats", {k: 0 for k in main.latency_stats})
+    monkeypatch.setattr(main, "llm_latencies", {})
+    monkeypatch.setattr(main, "FAST_PATH_SHADOW_SAMPLE_RATE", 0.0)
+
+
+@pytest.fixture
+def gemini(monkeypatch):
+    """Stub Gemini: answers with `replies[kind]`, or fails (None) when the reply is None"""
+    replies = {"response": "LLM response", "summary": "LLM summary", "actions": "LLM actions"}
+    calls = []
+
+    async def fake_call(kind, prompt, generation_config, deadline, shadow=False):
+        calls.append((kind, shadow))
+        return replies[kind]
+
+    monkeypatch.setattr(main, "call_gemini", fake_call)
+    return replies, calls
+
+
+def generate(review, rating):
+    async def run():
+        result = await main.generate_review_content(review, rating, main.Deadline(5))
+        if main._shadow_tasks:
+            await asyncio.gather(*main._shadow_tasks)
+        return result
+
+    return asyncio.run(run())
+
+
+def test_on_mode_serves_short_confident_review_locally(monkeypatch, gemini):
+    _, calls = gemini
+    monkeypatch.setattr(main, "FAST_PATH_MODE", "on")
+    analysis = main.local_classifier.analyze("Great food!", 5)
+
+    assert generate("Great food!", 5) == (
+        analysis.ai_response, analysis.summary, analysis.recommended_actions
+    )
+    assert calls == []
+    assert main.fast_path_stats["eligible_reviews"] == 1
+    assert main.fast_path_stats["local_reviews"] == 1
+    assert main.fast_path_stats["llm_calls_skipped"] == 3
+
+
+def test_on_mode_keeps_llm_response_for_longer_reviews(monkeypatch, gemini):
+    _, calls = gemini
+    monkeypatch.setattr(main, "FAST_PATH_MODE", "on")
+    review = "Great food and friendly staff tonight"
+
+    response, summary, _ = generate(review, 5)
+    assert response == "LLM response"
+    assert summary == main.local_classifier.analyze(review, 5).summary
+    assert calls == [("response", False)]
+    assert main.fast_path_stats["llm_calls_skipped"] == 2
+
+
+def test_shadow_mode_counts_eligible_but_skips_nothing(monkeypatch, gemini):
+    _, calls = gemini
+    monkeypatch.setattr(main, "FAST_PATH_MODE", "shadow")
+
+    assert generate("Great food!", 5) == ("LLM response", "LLM summary", "LLM actions")
+    assert len(calls) == 3
+    assert main.fast_path_stats["eligible_reviews"] == 1
+    assert main.fast_path_stats["local_reviews"] == 0
+    assert main.fast_path_stats["llm_calls_skipped"] == 0
+
+
+def test_off_mode_is_never_eligible(monkeypatch, gemini):
+    monkeypatch.setattr(main, "FAST_PATH_MODE", "off")
+
+    generate("Great food!", 5)
+    assert main.fast_path_stats["eligible_reviews"] == 0
+
+
+def test_failed_llm_calls_fall_back_to_local_templates(monkeypatch, gemini):
+    replies, _ = gemini
+    replies.update(response=None, summary=None, actions=None)
+    monkeypatch.setattr(main, "FAST_PATH_MODE", "shadow")
+    review = "Food was cold and the waiter was rude."
+    analysis = main.local_classifier.analyze(review, 1)
+
+    assert generate(review, 1) == (
+        analysis.ai_response, analysis.summary, analysis.recommended_actions
+    )
+    assert main.fast_path_stats["llm_fallbacks"] == 3
+    assert main.fast_path_stats["eligible_agreement_checks"] == 0
+
+
+def test_agreement_is_recorded_per_eligibility(monkeypatch, gemini):
+    replies, _ = gemini
+    monkeypatch.setattr(main, "FAST_PATH_MODE", "shadow")
+
+    replies["summary"] = "Customer loved the amazing food."
+    generate("Great food!", 5)
+    replies["summary"] = "Customer found the food terrible."
+    generate("The food was great and the staff were friendly, but the music was loud and "
+             "the seating was cramped, the bill was high and parking was hard to find", 4)
+
+    stats = main.fast_path_stats
+    assert (stats["eligible_agreement_checks"], stats["eligible_agreements"]) == (1, 1)
+    assert (stats["other_agreement_checks"], stats["other_agreements"]) == (1, 0)
+
+
+def test_mismatch_note_is_prepended_to_llm_actions(monkeypatch, gemini):
+    monkeypatch.setattr(main, "FAST_PATH_MODE", "on")
+
+    _, _, actions = generate("Terrible, rude staff", 5)
+    assert actions == "[Check: review text reads negative but rating is 5/5.] LLM actions"
+    assert main.fast_path_stats["rating_mismatches"] == 1
+    assert main.fast_path_stats["eligible_reviews"] == 0
+
+
+def test_shadow_sample_in_on_mode_stays_off_request_stats(monkeypatch, gemini):
+    replies, calls = gemini
+    monkeypatch.setattr(main, "FAST_PATH_MODE", "on")
+    monkeypatch.setattr(main, "FAST_PATH_SHADOW_SAMPLE_RATE", 1.0)
+    replies["summary"] = "Customer loved the food."
+
+    generate("Great food!", 5)
+    assert calls == [("summary", True)]
+    assert main.fast_path_stats["shadow_calls"] == 1
+    assert main.fast_path_stats["eligible_agreements"] == 1
+
+
+def test_shadow_gemini_calls_are_not_hedged_or_counted(monkeypatch):
+    monkeypatch.setattr(main, "HEDGE_DEFAULT_DELAY_SECONDS", 0.01)
+    posts = []
+
+    async def slow_post(client, payload):
+        posts.append(payload)
+        await asyncio.sleep(0.05)
+        return "summary"
+
+    monkeypatch.setattr(main, "_post_gemini", slow_post)
+
+    result = asyncio.run(main.call_gemini("summary", "prompt", {}, main.Deadline(1), shadow=True))
+    assert result == "summary"
+    assert len(posts) == 1
+    assert set(main.latency_stats.values()) == {0}
+    assert main.llm_latencies == {}
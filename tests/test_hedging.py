@@ -0,0 +1,119 @@
+import asyncio
+import time
+
+import pytest
+
+import src.main as main
+
+
+class FakeAsyncClient:
+    """Stands in for httpx.AsyncClient, whose setup time would eat into short test deadlines"""
+
+    def __init__(self, **kwargs):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+@pytest.fixture(autouse=True)
+def fresh_state(monkeypatch):
+    monkeypatch.setattr(main.httpx, "AsyncClient", FakeAsyncClient)
+    monkeypatch.setattr(main, "llm_latencies", {})
+    monkeypatch.setattr(main, "latency_stats", {k: 0 for k in main.latency_stats})
+    monkeypatch.setattr(main, "HEDGE_DEFAULT_DELAY_SECONDS", 0.05)
+    monkeypatch.setattr(main, "HEDGE_MIN_DELAY_SECONDS", 0.01)
+
+
+def stub_gemini(monkeypatch, *behaviours):
+    """Each call to _post_gemini takes the next (delay, result) pair; an Exception result is raised."""
+    queue = list(behaviours)
+    calls = []
+
+    async def fake_post(client, payload):
+        delay, result = queue.pop(0)
+        calls.append(delay)
+        await asyncio.sleep(delay)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    monkeypatch.setattr(main, "_post_gemini", fake_post)
+    return calls
+
+
+def call(deadline_seconds):
+    return asyncio.run(main.call_gemini("summary", "prompt", {}, main.Deadline(deadline_seconds)))
+
+
+def test_fast_primary_is_not_hedged(monkeypatch):
+    calls = stub_gemini(monkeypatch, (0.01, "primary"))
+
+    assert call(1) == "primary"
+    assert len(calls) == 1
+    assert main.latency_stats["hedged_calls"] == 0
+    assert len(main.llm_latencies["summary"]) == 1
+
+
+def test_slow_primary_is_hedged_and_hedge_wins(monkeypatch):
+    calls = stub_gemini(monkeypatch, (1.0, "primary"), (0.01, "hedge"))
+
+    started = time.monotonic()
+    assert call(2) == "hedge"
+    assert time.monotonic() - started < 0.5
+    assert len(calls) == 2
+    assert main.latency_stats["hedged_calls"] == 1
+    assert main.latency_stats["hedge_wins"] == 1
+    # The cancelled primary still contributes a lower-bound latency sample
+    [sample] = main.llm_latencies["summary"]
+    assert sample >= 0.05
+
+
+def test_budget_runs_out(monkeypatch):
+    stub_gemini(monkeypatch, (1.0, "primary"), (1.0, "hedge"))
+    deadline = main.Deadline(0.2)
+
+    started = time.monotonic()
+    assert asyncio.run(main.call_gemini("summary", "prompt", {}, deadline)) is None
+    assert time.monotonic() - started < 0.5
+    assert deadline.exhausted
+    assert main.latency_stats["llm_calls_timed_out"] == 1
+    # The primary started right after the deadline; allow for scheduling slack
+    assert main.llm_latencies["summary"][0] >= 0.1
+
+
+def test_expired_deadline_skips_the_call(monkeypatch):
+    calls = stub_gemini(monkeypatch)
+    deadline = main.Deadline(0)
+
+    assert asyncio.run(main.call_gemini("summary", "prompt", {}, deadline)) is None
+    assert calls == []
+    assert deadline.exhausted
+
+
+def test_failed_primary_returns_none_without_hedging(monkeypatch):
+    calls = stub_gemini(monkeypatch, (0.01, RuntimeError("boom")))
+
+    assert call(1) is None
+    assert len(calls) == 1
+    assert main.latency_stats["hedged_calls"] == 0
+
+
+def test_hedge_delay_tracks_percentile(monkeypatch):
+    monkeypatch.setattr(main, "HEDGE_PERCENTILE", 0.9)
+    for i in range(100):
+        main.record_latency("summary", 1.0 if i < 20 else 0.1)
+
+    assert main.hedge_delay("summary") == 1.0
+    assert main.hedge_delay("actions") == main.HEDGE_DEFAULT_DELAY_SECONDS
+
+
+def test_reserve_leaves_time_for_later_work():
+    deadline = main.Deadline(5)
+    llm_deadline = deadline.reserve(2)
+
+    assert 2.9 < llm_deadline.remaining() <= 3
+    assert deadline.remaining() > llm_deadline.remaining()
@@ -0,0 +1,145 @@
+import csv
+import json
+
+import pytest
+
+from src.local_classifier import LocalClassifier, evaluate, mismatch_note, tokenize, train
+
+
+@pytest.fixture
+def classifier():
+    return LocalClassifier.seed()
+
+
+def write_csv(path, rows):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["text", "stars"])
+        writer.writerows(rows)
+    return str(path)
+
+
+def test_tokenize_marks_negation_within_window():
+    assert tokenize("Not good at all really") == ["not_good", "not_at", "not_all", "really"]
+
+
+def test_tokenize_handles_typographic_apostrophes():
+    assert tokenize("I don’t love it") == ["i", "not_love", "not_it"]
+
+
+def test_negation_stops_at_commas_and_clause_words():
+    assert tokenize("Nothing special, average food") == ["not_special", "average", "food"]
+    assert tokenize("not good but great") == ["not_good", "but", "great"]
+
+
+def test_negated_seed_words_flip_sign(classifier):
+    assert classifier.predict("good")[0] > 3
+    assert classifier.predict("not good")[0] < 3
+
+
+def test_score_tokens_without_known_terms_is_neutral(classifier):
+    assert classifier.score_tokens(["xyzzy", "plugh"]) == (3.0, 0)
+
+
+def test_aspects_follow_clause_polarity(classifier):
+    aspects = classifier.aspects("Great food but the service was slow")
+    assert aspects == {"food": 1, "service": -1, "wait time": -1}
+
+
+def test_analyze_positive_review(classifier):
+    analysis = classifier.analyze("Great food!", 5)
+
+    assert analysis.confident
+    assert not analysis.mismatch
+    assert analysis.polarity == 1
+    assert analysis.summary == "Customer praises the food."
+    assert analysis.recommended_actions == "1. Highlight the praised dishes in menus and promotions."
+    assert "delighted you enjoyed the food" in analysis.ai_response
+
+
+def test_analyze_negative_review(classifier):
+    analysis = classifier.analyze("Food was cold and the waiter was rude.", 1)
+
+    assert analysis.polarity == -1
+    assert analysis.summary == "Customer is unhappy with the food and service."
+    assert analysis.recommended_actions.startswith("1. Review food quality")
+    assert analysis.ai_response.startswith("We sincerely apologize")
+
+
+def test_mixed_review_is_not_confident(classifier):
+    analysis = classifier.analyze("Great food but the service was slow", 3)
+
+    assert not analysis.confident
+    assert analysis.summary == (
+        "Mixed review: praises the food but criticises the service and wait time."
+    )
+
+
+@pytest.mark.parametrize("text, rating, note", [
+    ("Terrible, rude staff", 5, "[Check: review text reads negative but rating is 5/5.]"),
+    ("Amazing food", 1, "[Check: review text reads positive but rating is 1/5.]"),
+])
+def test_confident_opposite_polarity_is_a_mismatch(classifier, text, rating, note):
+    analysis = classifier.analyze(text, rating)
+
+    assert analysis.mismatch
+    assert mismatch_note(analysis, rating) == note
+    assert analysis.recommended_actions.startswith(note)
+
+
+@pytest.mark.parametrize("text, rating", [
+    ("The wait was long but worth it", 5),
+    ("Fine.", 1),
+    ("Great, just great. Waited two hours for cold food.", 1),
+    ("Terrible", 3),
+])
+def test_neutral_or_three_star_readings_are_not_mismatches(classifier, text, rating):
+    analysis = classifier.analyze(text, rating)
+
+    assert not analysis.mismatch
+    assert "[Check:" not in analysis.recommended_actions
+
+
+def test_load_missing_model_falls_back_to_seed(tmp_path):
+    assert LocalClassifier.load(str(tmp_path / "missing.json")).source == "seed"
+
+
+def test_load_trained_model(tmp_path):
+    path = tmp_path / "model.json"
+    path.write_text(json.dumps({"bias": 3.5, "weights": {"yum": 1.0}}))
+
+    classifier = LocalClassifier.load(str(path))
+    assert classifier.source == str(path)
+    assert classifier.predict("yum") == (4.5, 1)
+
+
+def test_evaluate_reports_accuracy_and_coverage(tmp_path, classifier):
+    path = write_csv(tmp_path / "yelp.csv", [
+        ["Great food, friendly staff", 5],
+        ["Rude waiter and cold food", 1],
+        ["Terrible", 3],
+        ["It was ok", 3],
+    ])
+
+    report = evaluate(classifier, path)
+    assert report["reviews"] == 4
+    assert report["exact_accuracy"] == 0.75
+    assert report["confident_rate"] == 0.75
+    # The confident 3-star review has no right polarity and is left out
+    assert report["confident_polarity_accuracy"] == 1.0
+    assert report["fast_path_rate"] == 0.75
+
+
+def test_train_learns_token_weights(tmp_path):
+    pytest.importorskip("numpy")
+    rows = [["yummy tasty place", 5], ["yucky gross place", 1]] * 10
+    path = write_csv(tmp_path / "yelp.csv", rows)
+
+    model = train(path, min_df=1, l2=1.0)
+    classifier = LocalClassifier(model["weights"], bias=model["bias"])
+
+    assert model["trained_on"] == 20
+    assert model["bias"] == 3.0
+    assert model["weights"]["yummy"] > 0 > model["weights"]["yucky"]
+    assert classifier.predict("yummy")[0] > 4
+    assert classifier.predict("yucky")[0] < 2